@@ -1,5 +1,7 @@
 import asyncio
 
+from kopf._cogs.aiokits import aiotasks
+
 
 async def condition_chain(
         source: asyncio.Condition,
@@ -11,9 +13,30 @@ async def condition_chain(
     It is a "clean" (not "dirty") hack to wake up the webhook configuration
     managers when either the resources are revised (as seen in the insights),
     or a new client config is yielded from the webhook server.
+
+    The target is notified by a background forwarder, so that the source's lock
+    is not held while waiting for the target's lock: the source's notifiers
+    are not blocked by the target's waiters. With the source held, the chain
+    only raises a "pending" flag, which is enough not to miss the wake-ups.
+
+    Bursts of the source's notifications are coalesced: while the target's
+    notification is pending (i.e. not yet delivered), it covers all the new
+    notifications of the source too, so the target is notified only once.
     """
-    async with source:
-        while True:
-            await source.wait()
-            async with target:
-                target.notify_all()
+    pending = asyncio.Event()
+    forwarder = aiotasks.create_task(_forward(pending, target), name="condition chain")
+    try:
+        async with source:
+            while True:
+                await source.wait()
+                pending.set()
+    finally:
+        await aiotasks.stop([forwarder], title="condition chain", quiet=True)
+
+
+async def _forward(pending: asyncio.Event, target: asyncio.Condition) -> None:
+    while True:
+        await pending.wait()
+        async with target:
+            pending.clear()  # all the source's notifications since now will need a new round
+            target.notify_all()
@@ -2,12 +2,18 @@ import asyncio
 import enum
 import threading
 import time
-from typing import Awaitable, Generator, Generic, Optional, TypeVar
+from typing import Awaitable, Generator, Generic, Optional, Type, TypeVar
 
-from kopf._cogs.aiokits import aiotasks
+from kopf._cogs.aiokits import aiotasks, aiotime
 
 FlagReasonT = TypeVar('FlagReasonT', bound=enum.Flag)
 
+# The lowest bit of the setter's state; the reasons' values are shifted above it.
+_SET = 1
+
+# Only for the rare creation of the setters' threading events, not for their usage.
+_sync_event_lock = threading.Lock()
+
 
 class FlagSetter(Generic[FlagReasonT]):
     """
@@ -31,15 +37,18 @@ class FlagSetter(Generic[FlagReasonT]):
         The orphan threads will block the operator's process from exiting,
         thus affecting the speed of restarts.
     """
+    __slots__ = ('when', '_state', '_reason_type', '_sync_event',
+                 '_async_future', '_sync_waiter', '_async_waiter')
 
     def __init__(self) -> None:
         super().__init__()
         self.when: Optional[float] = None
-        self.reason: Optional[FlagReasonT] = None
-        self.sync_event = threading.Event()
-        self.async_event = asyncio.Event()
-        self.sync_waiter: SyncFlagWaiter[FlagReasonT] = SyncFlagWaiter(self)
-        self.async_waiter: AsyncFlagWaiter[FlagReasonT] = AsyncFlagWaiter(self)
+        self._state: int = 0  # the "set" bit & the reasons' bits, for fast lock-free checks.
+        self._reason_type: Optional[Type[FlagReasonT]] = None
+        self._sync_event: Optional[threading.Event] = None
+        self._async_future: Optional[aiotasks.Future] = None
+        self._sync_waiter: Optional[SyncFlagWaiter[FlagReasonT]] = None
+        self._async_waiter: Optional[AsyncFlagWaiter[FlagReasonT]] = None
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}: {self.is_set()}, reason={self.reason}>'
@@ -48,15 +57,86 @@ class FlagSetter(Generic[FlagReasonT]):
         """
         Check if the daemon stopper is set: at all or for a specific reason.
         """
-        matching_reason = reason is None or (self.reason is not None and reason in self.reason)
-        return matching_reason and self.sync_event.is_set()
+        if reason is None:
+            return bool(self._state & _SET)
+
+        # NB: `._value_` is a plain attribute, while `.value` is a relatively slow descriptor.
+        # Some reasons must be given at all, even for an empty reason (as `Flag(0) in None` fails).
+        mask = _SET | reason._value_ << 1
+        return self._state & mask == mask and self._reason_type is not None
+
+    @property
+    def reason(self) -> Optional[FlagReasonT]:
+        # The reasons are kept as bits; the flag objects are built only when really needed.
+        # The type is remembered when any reason is given, even an empty one, e.g. `Reason(0)`.
+        return None if self._reason_type is None else self._reason_type(self._state >> 1)
+
+    @property
+    def sync_event(self) -> threading.Event:
+        """
+        A threading event, which is set when the flag is set.
+
+        It is needed only for the sync daemons waiting in their threads,
+        so it is created on demand, maybe concurrently with the flag's setting:
+        whichever side comes last, it sees the other's change and sets the event.
+        """
+        event = self._sync_event
+        if event is None:
+            with _sync_event_lock:
+                event = self._sync_event
+                if event is None:
+                    event = self._sync_event = threading.Event()
+        if self._state & _SET and not event.is_set():
+            event.set()
+        return event
+
+    @property
+    def async_future(self) -> aiotasks.Future:
+        """
+        A one-shot future, which is resolved when the flag is set.
+
+        Most daemons never wait for it and rely on task cancellation instead,
+        so it is created on demand. Since it is shared by all async waiters,
+        it must never be awaited directly: either shielded, or observed via
+        callbacks, so that no waiter's cancellation cancels it for the others.
+        """
+        if self._async_future is None:
+            self._async_future = asyncio.get_running_loop().create_future()
+            if self._state & _SET:
+                self._async_future.set_result(None)
+        return self._async_future
+
+    @property
+    def sync_waiter(self) -> "SyncFlagWaiter[FlagReasonT]":
+        if self._sync_waiter is None:
+            self._sync_waiter = SyncFlagWaiter(self)
+        return self._sync_waiter
+
+    @property
+    def async_waiter(self) -> "AsyncFlagWaiter[FlagReasonT]":
+        if self._async_waiter is None:
+            self._async_waiter = AsyncFlagWaiter(self)
+        return self._async_waiter
 
     def set(self, reason: Optional[FlagReasonT] = None) -> None:
-        reason = reason if reason is not None else self.reason  # to keep existing values
-        self.when = self.when if self.when is not None else time.monotonic()
-        self.reason = reason if self.reason is None or reason is None else self.reason | reason
-        self.sync_event.set()
-        self.async_event.set()  # it is thread-safe: always called in operator's event loop.
+        was_set = self._state & _SET
+        if reason is None:
+            self._state |= _SET  # and keep the existing reasons, if any
+        else:
+            self._state |= _SET | reason._value_ << 1
+            self._reason_type = type(reason)
+
+        # Only the first call notifies the waiters; repeated calls only add the reasons.
+        # The async future is not resolved if never requested: it is pre-set on creation instead.
+        # The same for the threading event, which exists only for the sync daemons' threads.
+        if not was_set:
+            self.when = time.monotonic()  # not loop.time(): it is compared to the system's clock.
+            event = self._sync_event
+            if event is not None:
+                event.set()
+            future = self._async_future
+            if future is not None and not future.done():
+                future.set_result(None)  # thread-safe: always called in operator's event loop.
 
 
 class FlagWaiter(Generic[FlagReasonT]):
@@ -76,6 +156,7 @@ class FlagWaiter(Generic[FlagReasonT]):
                 ...
                 stopped.wait(60)
     """
+    __slots__ = ('_setter',)
 
     def __init__(self, setter: FlagSetter[FlagReasonT]) -> None:
         super().__init__()
@@ -84,11 +165,12 @@ class FlagWaiter(Generic[FlagReasonT]):
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}: {self.is_set()}, reason={self.reason}>'
 
+    # Polled on every cycle of the daemons (`while not stopped:`), so the setter's check is inlined.
     def __bool__(self) -> bool:
-        return self._setter.is_set()
+        return bool(self._setter._state & _SET)
 
     def is_set(self) -> bool:
-        return self._setter.is_set()
+        return bool(self._setter._state & _SET)
 
     @property
     def reason(self) -> Optional[FlagReasonT]:
@@ -107,13 +189,27 @@ class FlagWaiter(Generic[FlagReasonT]):
 
 
 class SyncFlagWaiter(FlagWaiter[FlagReasonT], Generic[FlagReasonT]):
+    __slots__ = ()
+
     def wait(self, timeout: Optional[float] = None) -> "SyncFlagWaiter[FlagReasonT]":
         self._setter.sync_event.wait(timeout=timeout)
         return self
 
 
 class AsyncFlagWaiter(FlagWaiter[FlagReasonT], Generic[FlagReasonT]):
+    __slots__ = ('_instant_promise',)
+
+    def __init__(self, setter: FlagSetter[FlagReasonT]) -> None:
+        super().__init__(setter)
+        self._instant_promise: Optional[AsyncFlagPromise[FlagReasonT]] = None
+
     def wait(self, timeout: Optional[float] = None) -> "AsyncFlagPromise[FlagReasonT]":
+        # If there is nothing to wait for, reuse the same instant checker, e.g. at shutdown polling.
+        if _is_instant(self._setter, timeout):
+            if self._instant_promise is None:
+                self._instant_promise = AsyncFlagPromise(self, timeout=0)
+            return self._instant_promise
+
         # A new checker instance, which is awaitable and returns the original checker in the end.
         return AsyncFlagPromise(self, timeout=timeout)
 
@@ -150,7 +246,12 @@ class AsyncFlagPromise(FlagWaiter[FlagReasonT],
     To follow the established signatures of the primary (sync) use-case,
     the secondary (async) use-case also returns an instance of the checker:
     but not "self"! Instead, it creates a new time-limited & awaitable checker
-    for every call to ``stopped.wait(n)``, limiting its life by ``n`` seconds.
+    for every call to ``stopped.wait(n)`` with a positive or no timeout,
+    limiting its life by ``n`` seconds (if given).
+
+    If there is nothing to wait for --- the flag is already set, or the timeout
+    is zero or negative --- one cached instant checker of the original checker
+    is returned instead, and awaiting it returns the original checker at once.
 
     Extra checker instances add some tiny memory overhead, but this is fine
     since the use-case is discouraged and there is a better native alternative.
@@ -158,7 +259,10 @@ class AsyncFlagPromise(FlagWaiter[FlagReasonT],
     Then, going back through the class hierarchy, all classes are made awaitable
     so that this functionality becomes exposed via the declared base class.
     But all checkers except the time-limited one prohibit waiting for them.
+
+    Since these promises are created on most calls, they have no ``__dict__``.
     """
+    __slots__ = ('_timeout', '_waiter')
 
     def __init__(self, waiter: AsyncFlagWaiter[FlagReasonT], *, timeout: Optional[float]) -> None:
         super().__init__(waiter._setter)
@@ -166,11 +270,19 @@ class AsyncFlagPromise(FlagWaiter[FlagReasonT],
         self._waiter = waiter
 
     def __await__(self) -> Generator[None, None, AsyncFlagWaiter[FlagReasonT]]:
-        name = f"time-limited waiting for the daemon stopper {self._setter!r}"
-        coro = asyncio.wait_for(self._setter.async_event.wait(), timeout=self._timeout)
-        task = aiotasks.create_task(coro, name=name)
-        try:
-            yield from task
-        except asyncio.TimeoutError:
-            pass  # the requested time limit is reached, exit regardless of the state
+        # Re-checked here, since the flag can be set between `stopped.wait(n)` and awaiting it.
+        if _is_instant(self._setter, self._timeout):
+            return self._waiter  # no need to create the future for the instant result.
+
+        # No tasks and no wait_for(): we are already in a task, and the future accepts callbacks.
+        # The shared future is shielded or never awaited directly, so it is never cancelled.
+        future = self._setter.async_future
+        if self._timeout is None:
+            yield from asyncio.shield(future).__await__()
+        else:
+            yield from aiotime.sleep(self._timeout, wakeup=future).__await__()
         return self._waiter  # the original checker! not the time-limited one!
+
+
+def _is_instant(setter: FlagSetter[FlagReasonT], timeout: Optional[float]) -> bool:
+    return setter.is_set() or (timeout is not None and timeout <= 0)
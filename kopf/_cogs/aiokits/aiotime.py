@@ -1,36 +1,72 @@
 import asyncio
-import collections.abc
-from typing import Collection, Optional, Union
+import functools
+from typing import Any, Collection, Optional, Union
+
+from kopf._cogs.aiokits import aiotasks
 
 
 async def sleep(
         delays: Union[None, float, Collection[Union[None, float]]],
-        wakeup: Optional[asyncio.Event] = None,
+        wakeup: Union[None, asyncio.Event, aiotasks.Future] = None,
 ) -> Optional[float]:
     """
     Measure the sleep time: either until the timeout, or until the event is set.
 
+    The wake-up flag can be either an event or a future (e.g. a one-shot flag).
+    The future is never cancelled by the sleep, so it can be shared by sleepers.
+
     Returns the number of seconds left to sleep, or ``None`` if the sleep was
     not interrupted and reached its specified delay (an equivalent of ``0``).
     In theory, the result can be ``0`` if the sleep was interrupted precisely
     the last moment before timing out; this is unlikely to happen though.
     """
-    passed_delays = delays if isinstance(delays, collections.abc.Collection) else [delays]
-    actual_delays = [delay for delay in passed_delays if delay is not None]
-    minimal_delay = min(actual_delays) if actual_delays else 0
+    # The most frequent case (daemons & timers) is a single delay: no need to pick the shortest.
+    if isinstance(delays, (int, float)):
+        minimal_delay = delays
+    elif delays is None:
+        return None
+    else:
+        minimal_delay = min((delay for delay in delays if delay is not None), default=0)
 
     # Do not go for the real low-level system sleep if there is no need to sleep.
     if minimal_delay <= 0:
         return None
 
-    awakening_event = wakeup if wakeup is not None else asyncio.Event()
+    # Nothing can interrupt the sleep, so there is no need for events, timeouts, extra tasks.
+    if wakeup is None:
+        await asyncio.sleep(minimal_delay)
+        return None
+
     loop = asyncio.get_running_loop()
-    try:
-        start_time = loop.time()
-        await asyncio.wait_for(awakening_event.wait(), timeout=minimal_delay)
-    except asyncio.TimeoutError:
-        return None  # interruptable sleep is over: uninterrupted.
+    loop_time = loop.time
+    if isinstance(wakeup, asyncio.Event):
+        start_time = loop_time()
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=minimal_delay)
+        except asyncio.TimeoutError:
+            return None  # interruptable sleep is over: uninterrupted.
+        else:
+            return max(0., minimal_delay - (loop_time() - start_time))
+
+    # Futures accept callbacks, so we can go without wait_for()'s task & cancellation machinery.
+    # The shared wake-up future is never awaited directly, so it is never cancelled by us.
+    elif wakeup.done():
+        return minimal_delay
     else:
-        end_time = loop.time()
-        duration = end_time - start_time
-        return max(0., minimal_delay - duration)
+        waiter = loop.create_future()
+        awaken = functools.partial(_resolve, waiter, True)
+        timer = loop.call_later(minimal_delay, _resolve, waiter, False)
+        wakeup.add_done_callback(awaken)
+        try:
+            if not await waiter:
+                return None  # interruptable sleep is over: uninterrupted.
+            else:
+                return max(0., timer.when() - loop_time())
+        finally:
+            timer.cancel()
+            wakeup.remove_done_callback(awaken)
+
+
+def _resolve(waiter: aiotasks.Future, result: bool, *_: Any) -> None:
+    if not waiter.done():  # either by timeout or by wake-up, whatever happens first.
+        waiter.set_result(result)
@@ -465,7 +465,7 @@ async def _daemon(
     body = cause.body
 
     if handler.initial_delay is not None:
-        await aiotime.sleep(handler.initial_delay, wakeup=cause.stopper.async_event)
+        await aiotime.sleep(handler.initial_delay, wakeup=cause.stopper.async_future)
 
     # Similar to activities (in-memory execution), but applies patches on every attempt.
     state = progression.State.from_scratch().with_handlers([handler])
@@ -491,7 +491,7 @@ async def _daemon(
 
         # The in-memory sleep does not react to resource changes, but only to stopping.
         if state.delay:
-            await aiotime.sleep(state.delay, wakeup=cause.stopper.async_event)
+            await aiotime.sleep(state.delay, wakeup=cause.stopper.async_future)
 
     if stopper.is_set():
         logger.debug(f"{handler} has exited on request and will not be retried or restarted.")
@@ -534,7 +534,7 @@ async def _timer(
     body = cause.body
 
     if handler.initial_delay is not None:
-        await aiotime.sleep(handler.initial_delay, wakeup=stopper.async_event)
+        await aiotime.sleep(handler.initial_delay, wakeup=stopper.async_future)
 
     # Similar to activities (in-memory execution), but applies patches on every attempt.
     state = progression.State.from_scratch().with_handlers([handler])
@@ -550,7 +550,7 @@ async def _timer(
         if handler.idle is not None:
             while not stopper.is_set() and time.monotonic() - memory.idle_reset_time < handler.idle:
                 delay = memory.idle_reset_time + handler.idle - time.monotonic()
-                await aiotime.sleep(delay, wakeup=stopper.async_event)
+                await aiotime.sleep(delay, wakeup=stopper.async_future)
             if stopper.is_set():
                 continue
 
@@ -579,7 +579,7 @@ async def _timer(
         # For temporary errors, override the schedule by the one provided by errors themselves.
         # It can be either a delay from TemporaryError, or a backoff for an arbitrary exception.
         if not state.done:
-            await aiotime.sleep(state.delays, wakeup=stopper.async_event)
+            await aiotime.sleep(state.delays, wakeup=stopper.async_future)
 
         # For sharp timers, calculate how much time is left to fit the interval grid:
         #       |-----|-----|-----|-----|-----|-----|---> (interval=5, sharp=True)
@@ -587,19 +587,19 @@ async def _timer(
         elif handler.interval is not None and handler.sharp:
             passed_duration = time.monotonic() - started
             remaining_delay = handler.interval - (passed_duration % handler.interval)
-            await aiotime.sleep(remaining_delay, wakeup=stopper.async_event)
+            await aiotime.sleep(remaining_delay, wakeup=stopper.async_future)
 
         # For regular (non-sharp) timers, simply sleep from last exit to the next call:
         #       |-----|-----|-----|-----|-----|-----|---> (interval=5, sharp=False)
         #       [slow_handler].....[slow_handler].....[slow...
         elif handler.interval is not None:
-            await aiotime.sleep(handler.interval, wakeup=stopper.async_event)
+            await aiotime.sleep(handler.interval, wakeup=stopper.async_future)
 
         # For idle-only no-interval timers, wait till the next change (i.e. idling reset).
         # NB: This will skip the handler in the same tact (1/64th of a second) even if changed.
         elif handler.idle is not None:
             while memory.idle_reset_time <= started:
-                await aiotime.sleep(handler.idle, wakeup=stopper.async_event)
+                await aiotime.sleep(handler.idle, wakeup=stopper.async_future)
 
         # Only in case there are no intervals and idling, treat it as a one-shot handler.
         # This makes the handler practically meaningless, but technically possible.
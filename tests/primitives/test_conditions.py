@@ -39,3 +39,27 @@ async def test_triggering(event_loop, timer):
     finally:
         task.cancel()
         await asyncio.wait([task])
+
+
+async def test_coalescing_of_bursts(mocker):
+    source = asyncio.Condition()
+    target = asyncio.Condition()
+    spy = mocker.spy(target, 'notify_all')
+    task = asyncio.create_task(condition_chain(source, target))
+    try:
+        await asyncio.sleep(0.01)  # let the chain start waiting
+
+        # Block the target's notifications until the burst is over.
+        async with target:
+            for _ in range(3):
+                async with source:
+                    source.notify_all()
+                await asyncio.sleep(0.01)  # let the chain handle it
+            assert spy.call_count == 0
+
+        await asyncio.sleep(0.01)  # let the chain deliver the notification
+        assert spy.call_count == 1
+
+    finally:
+        task.cancel()
+        await asyncio.wait([task])
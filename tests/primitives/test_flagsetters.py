@@ -0,0 +1,190 @@
+import asyncio
+import enum
+
+from kopf._cogs.aiokits.aioenums import FlagSetter
+
+
+class Reason(enum.Flag):
+    A = enum.auto()
+    B = enum.auto()
+    C = enum.auto()
+
+
+async def test_initially_unset():
+    setter = FlagSetter[Reason]()
+    assert not setter.is_set()
+    assert not setter.is_set(Reason.A)
+    assert setter.reason is None
+    assert setter.when is None
+
+
+async def test_setting_with_no_reason():
+    setter = FlagSetter[Reason]()
+    setter.set()
+    assert setter.is_set()
+    assert not setter.is_set(Reason.A)
+    assert setter.reason is None
+    assert setter.when is not None
+
+
+async def test_setting_with_a_reason():
+    setter = FlagSetter[Reason]()
+    setter.set(Reason.A)
+    assert setter.is_set()
+    assert setter.is_set(Reason.A)
+    assert not setter.is_set(Reason.B)
+    assert not setter.is_set(Reason.A | Reason.B)
+    assert setter.reason == Reason.A
+
+
+async def test_setting_with_multiple_reasons():
+    setter = FlagSetter[Reason]()
+    setter.set(Reason.A)
+    setter.set()
+    setter.set(Reason.B)
+    assert setter.is_set(Reason.A)
+    assert setter.is_set(Reason.B)
+    assert setter.is_set(Reason.A | Reason.B)
+    assert not setter.is_set(Reason.C)
+    assert setter.reason == Reason.A | Reason.B
+
+
+async def test_time_is_kept_from_the_first_setting():
+    setter = FlagSetter[Reason]()
+    setter.set(Reason.A)
+    when = setter.when
+    setter.set(Reason.B)
+    assert setter.when == when
+
+
+async def test_async_waiting_times_out(timer):
+    setter = FlagSetter[Reason]()
+    with timer:
+        result = await setter.async_waiter.wait(0.1)
+    assert 0.1 <= timer.seconds < 0.2
+    assert result is setter.async_waiter
+    assert not result
+
+
+async def test_async_waiting_is_instant_when_preset(timer):
+    setter = FlagSetter[Reason]()
+    setter.set(Reason.A)
+    with timer:
+        result = await setter.async_waiter.wait(10)
+    assert timer.seconds < 0.01
+    assert result is setter.async_waiter
+    assert result
+
+
+async def test_async_waiting_is_interrupted_by_setting(event_loop, timer):
+    setter = FlagSetter[Reason]()
+    event_loop.call_later(0.1, setter.set, Reason.A)
+    with timer:
+        result = await setter.async_waiter.wait()
+    assert 0.1 <= timer.seconds < 0.2
+    assert result is setter.async_waiter
+    assert result
+
+
+async def test_async_waiting_cancellation_keeps_the_future():
+    setter = FlagSetter[Reason]()
+    task1 = asyncio.ensure_future(setter.async_waiter.wait())
+    task2 = asyncio.ensure_future(setter.async_waiter.wait(10))
+    await asyncio.sleep(0.01)
+    task1.cancel()
+    task2.cancel()
+    await asyncio.wait([task1, task2])
+    assert not setter.async_future.done()
+    setter.set()
+    assert setter.async_future.done()
+
+
+async def test_async_waiting_does_not_format_the_setter(mocker):
+    setter = FlagSetter[Reason]()
+    repr_mock = mocker.patch.object(FlagSetter, '__repr__', return_value='<setter>')
+    await setter.async_waiter.wait(0.01)
+    assert not repr_mock.called
+
+
+async def test_async_waiting_promises_are_reused_when_preset():
+    setter = FlagSetter[Reason]()
+    setter.set()
+    promise1 = setter.async_waiter.wait(10)
+    promise2 = setter.async_waiter.wait()
+    assert promise1 is promise2
+    assert await promise1 is setter.async_waiter
+    assert await promise2 is setter.async_waiter
+
+
+async def test_async_waiting_promises_are_reused_for_zero_timeouts(timer):
+    setter = FlagSetter[Reason]()
+    promise1 = setter.async_waiter.wait(0)
+    promise2 = setter.async_waiter.wait(-1)
+    assert promise1 is promise2
+    with timer:
+        result = await promise1
+    assert timer.seconds < 0.01
+    assert result is setter.async_waiter
+    assert not result
+
+
+async def test_waiters_follow_the_setter():
+    setter = FlagSetter[Reason]()
+    assert not setter.sync_waiter
+    assert not setter.async_waiter
+    assert not setter.sync_waiter.is_set()
+    assert not setter.async_waiter.is_set()
+    setter.set(Reason.A)
+    assert setter.sync_waiter
+    assert setter.async_waiter
+    assert setter.sync_waiter.is_set()
+    assert setter.async_waiter.is_set()
+    assert setter.sync_waiter.reason == Reason.A
+    assert setter.async_waiter.reason == Reason.A
+
+
+async def test_sync_waiting_times_out(timer):
+    setter = FlagSetter[Reason]()
+    with timer:
+        result = setter.sync_waiter.wait(0.1)
+    assert 0.1 <= timer.seconds < 0.2
+    assert result is setter.sync_waiter
+    assert not result
+
+
+async def test_sync_waiting_is_instant_when_preset(timer):
+    setter = FlagSetter[Reason]()
+    setter.set(Reason.A)
+    with timer:
+        result = setter.sync_waiter.wait(10)
+    assert timer.seconds < 0.01
+    assert result is setter.sync_waiter
+    assert result
+
+
+async def test_sync_waiting_is_interrupted_by_setting(event_loop, timer):
+    setter = FlagSetter[Reason]()
+    event_loop.call_later(0.1, setter.set, Reason.A)
+    with timer:
+        result = await event_loop.run_in_executor(None, setter.sync_waiter.wait, 10)
+    assert 0.1 <= timer.seconds < 0.2
+    assert result is setter.sync_waiter
+    assert result
+
+
+async def test_empty_reason_requires_some_reasons():
+    setter = FlagSetter[Reason]()
+    setter.set()
+    assert not setter.is_set(Reason(0))
+    setter.set(Reason.A)
+    assert setter.is_set(Reason(0))
+
+
+async def test_setting_with_an_empty_reason():
+    setter = FlagSetter[Reason]()
+    setter.set(Reason(0))
+    assert setter.is_set()
+    assert setter.is_set(Reason(0))
+    assert not setter.is_set(Reason.A)
+    assert setter.reason is not None
+    assert setter.reason == Reason(0)
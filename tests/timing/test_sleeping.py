@@ -75,3 +75,42 @@ async def test_with_zero_time_and_event_initially_set(timer):
         unslept = await sleep(0, event)
     assert timer.seconds <= 0.01
     assert not unslept  # 0/None; undefined for such case: both goals reached.
+
+
+async def test_by_future_set_before_time_comes(timer):
+    future = asyncio.get_running_loop().create_future()
+    asyncio.get_running_loop().call_later(0.07, future.set_result, None)
+    with timer:
+        unslept = await sleep(0.10, future)
+    assert unslept is not None
+    assert 0.02 <= unslept <= 0.04
+    assert 0.06 <= timer.seconds <= 0.08
+
+
+async def test_by_future_unset_is_not_cancelled_on_timeout(timer):
+    future = asyncio.get_running_loop().create_future()
+    with timer:
+        unslept = await sleep(0.10, future)
+    assert unslept is None
+    assert 0.10 <= timer.seconds < 0.11
+    assert not future.done()
+
+
+async def test_by_future_unset_is_not_cancelled_on_cancellation():
+    future = asyncio.get_running_loop().create_future()
+    task = asyncio.create_task(sleep(10, future))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.wait([task])
+    assert task.cancelled()
+    assert not future.done()
+
+
+async def test_with_future_initially_set(timer):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(None)
+    with timer:
+        unslept = await sleep(0.10, future)
+    assert timer.seconds <= 0.01
+    assert unslept is not None
+    assert 0.09 <= unslept <= 0.10